@@ -1,6 +1,7 @@
 """CLI entry point for nanobot-web-console."""
 
 import argparse
+import os
 import sys
 
 
@@ -21,6 +22,12 @@ def main():
         "--reload", action="store_true",
         help="enable auto-reload for development",
     )
+    parser.add_argument(
+        "--workers", type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", "1")),
+        help="worker process count (default: $WEB_CONCURRENCY or 1); "
+             "each worker runs its own agent, and WebSocket state is worker-local",
+    )
     parser.add_argument(
         "--version", action="store_true",
         help="show version and exit",
@@ -33,11 +40,18 @@ def main():
         sys.exit(0)
 
     import uvicorn
+
+    # "auto" picks uvloop and httptools when importable (perf extra:
+    # pip install nanobot-web-console[perf]) and falls back to the stdlib
+    # loop / h11 parser otherwise.
     uvicorn.run(
         "nanobot_web_console.server:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=args.workers,
+        loop="auto",
+        http="auto",
     )
 
 
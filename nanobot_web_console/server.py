@@ -5,6 +5,10 @@ Listens on 0.0.0.0:18790
 """
 
 import asyncio
+import copy
+import functools
+import gzip
+import hashlib
 import json
 import logging
 import os
@@ -15,9 +19,10 @@ import uuid
 from pathlib import Path
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
 from nanobot.config.loader import load_config
@@ -497,13 +502,76 @@ _EMOTION_RULES = [
 ]
 
 
+# All rules compiled into one alternation: a single C-level scan instead of
+# one re.search per rule, and IGNORECASE instead of allocating text.lower().
+# Each branch is a zero-width lookahead so matches consume no text — rules
+# whose spans overlap (e.g. "天气.*晴" swallowing "出错") are all still
+# discovered — and the lowest matching rule index wins, preserving the
+# Negative-rules-first priority above.
+_EMOTION_RE = re.compile(
+    "|".join(f"(?=(?P<g{i}>{pattern}))" for i, (pattern, _) in enumerate(_EMOTION_RULES)),
+    re.IGNORECASE,
+)
+
+# Hyperscan (optional) — install with: pip install hyperscan
+# Compiles the rule set into a DFA scanned in effectively constant time in
+# the number of rules; the compiled-re alternation above stays as fallback.
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None
+
+_EMOTION_DB = None
+if _hyperscan is not None:
+    try:
+        _EMOTION_DB = _hyperscan.Database()
+        _flags = _hyperscan.HS_FLAG_CASELESS | _hyperscan.HS_FLAG_SINGLEMATCH | _hyperscan.HS_FLAG_UTF8
+        _EMOTION_DB.compile(
+            expressions=[pattern.encode() for pattern, _ in _EMOTION_RULES],
+            ids=list(range(len(_EMOTION_RULES))),
+            flags=[_flags] * len(_EMOTION_RULES),
+        )
+    except Exception:
+        _EMOTION_DB = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_emotion_cached(text: str) -> str:
+    return _detect_emotion_uncached(text)
+
+
 def _detect_emotion(text: str) -> str:
-    """Detect emotion from response text using keyword rules."""
-    lower = text.lower()
-    for pattern, emotion in _EMOTION_RULES:
-        if re.search(pattern, lower):
-            return emotion
-    return "neutral"
+    """Detect emotion from response text using keyword rules.
+
+    Short replies repeat constantly in chat (greetings, acknowledgements,
+    canned errors), so those are memoized; long texts rarely recur and
+    would only evict useful entries, so they go straight to the scan.
+    """
+    if len(text) <= 256:
+        return _detect_emotion_cached(text)
+    return _detect_emotion_uncached(text)
+
+
+def _detect_emotion_uncached(text: str) -> str:
+    if _EMOTION_DB is not None:
+        hits: list[int] = []
+
+        def _on_match(rule_id, _start, _end, _flags, _ctx):
+            hits.append(rule_id)
+
+        try:
+            # SINGLEMATCH reports each rule at most once; scan the whole
+            # text so priority is decided by rule index, not match order.
+            _EMOTION_DB.scan(text.encode(), match_event_handler=_on_match)
+        except Exception as e:
+            logger.warning(f"Hyperscan scan failed ({e}), using regex fallback")
+        else:
+            return _EMOTION_RULES[min(hits)][1] if hits else "neutral"
+    best = min(
+        (int(m.lastgroup[1:]) for m in _EMOTION_RE.finditer(text)),
+        default=None,
+    )
+    return "neutral" if best is None else _EMOTION_RULES[best][1]
 
 
 # ---- Emotion-aware event enrichment ----
@@ -515,14 +583,28 @@ _EVENT_EMOTIONS = {
 }
 
 
+def _make_static_enricher(emotion: str):
+    def _enrich(event: dict) -> dict:
+        event["emotion"] = emotion
+        return event
+    return _enrich
+
+
+def _enrich_done(event: dict) -> dict:
+    event["emotion"] = _detect_emotion(event.get("content", ""))
+    return event
+
+
+# One lookup + one call per event instead of an if/elif chain; unknown
+# types fall through untouched.
+_EVENT_ENRICHERS = {t: _make_static_enricher(e) for t, e in _EVENT_EMOTIONS.items()}
+_EVENT_ENRICHERS["done"] = _enrich_done
+
+
 def _enrich_event(event: dict) -> dict:
     """Add emotion field to streaming events."""
-    etype = event.get("type", "")
-    if etype in _EVENT_EMOTIONS:
-        event["emotion"] = _EVENT_EMOTIONS[etype]
-    elif etype == "done":
-        event["emotion"] = _detect_emotion(event.get("content", ""))
-    return event
+    fn = _EVENT_ENRICHERS.get(event.get("type", ""))
+    return fn(event) if fn else event
 
 
 def _make_provider(config):
@@ -595,19 +677,44 @@ bus: MessageBus = None
 viking = None
 _config = None
 _feishu_client = None
+_console_bytes: bytes = b""
+_console_gzip: bytes = b""
 
 # ---- Feishu Outbound Dispatcher ----
 
+# Hoisted so the hot send path doesn't re-run the import machinery per
+# message; None when lark-oapi is not installed.
+try:
+    from lark_oapi.api.im.v1 import (
+        CreateMessageRequest as _FeishuCreateMessageRequest,
+        CreateMessageRequestBody as _FeishuCreateMessageRequestBody,
+    )
+except ImportError:
+    _FeishuCreateMessageRequest = None
+    _FeishuCreateMessageRequestBody = None
+
+# Static card scaffolding shared across sends; only the markdown element
+# differs per message.
+_FEISHU_CARD_CONFIG = {"wide_screen_mode": True}
+
+
 def _init_feishu_client(config):
     """Initialize Feishu lark-oapi client from nanobot config."""
     global _feishu_client
     try:
         import lark_oapi as lark
-        cfg_path = Path.home() / ".nanobot" / "config.json"
-        raw = json.loads(cfg_path.read_text())
-        fc = raw.get("channels", {}).get("feishu", {})
-        app_id = fc.get("appId", "")
-        app_secret = fc.get("appSecret", "")
+        # Prefer the config object we already parsed in lifespan; only fall
+        # back to re-reading the file when the loaded schema doesn't surface
+        # the feishu channel.
+        fc = getattr(getattr(config, "channels", None), "feishu", None)
+        app_id = getattr(fc, "app_id", None) or getattr(fc, "appId", None) or ""
+        app_secret = getattr(fc, "app_secret", None) or getattr(fc, "appSecret", None) or ""
+        if not (app_id and app_secret):
+            cfg_path = Path.home() / ".nanobot" / "config.json"
+            raw = orjson.loads(cfg_path.read_bytes())
+            raw_fc = raw.get("channels", {}).get("feishu", {})
+            app_id = raw_fc.get("appId", "")
+            app_secret = raw_fc.get("appSecret", "")
         if not (app_id and app_secret):
             print("[nanobot-api] Feishu credentials not found, outbound messaging disabled")
             return
@@ -626,21 +733,20 @@ def _send_feishu_message(receive_id: str, content: str) -> bool:
     if not _feishu_client:
         return False
     try:
-        from lark_oapi.api.im.v1 import (
-            CreateMessageRequest, CreateMessageRequestBody,
-        )
         receive_id_type = "chat_id" if receive_id.startswith("oc_") else "open_id"
+        # Fresh dict per call (cheap) rather than mutating a shared template:
+        # sends may run concurrently on executor threads.
         card = {
-            "config": {"wide_screen_mode": True},
+            "config": _FEISHU_CARD_CONFIG,
             "elements": [{"tag": "markdown", "content": content}],
         }
-        request = CreateMessageRequest.builder() \
+        request = _FeishuCreateMessageRequest.builder() \
             .receive_id_type(receive_id_type) \
             .request_body(
-                CreateMessageRequestBody.builder()
+                _FeishuCreateMessageRequestBody.builder()
                 .receive_id(receive_id)
                 .msg_type("interactive")
-                .content(json.dumps(card, ensure_ascii=False))
+                .content(orjson.dumps(card).decode())
                 .build()
             ).build()
         response = _feishu_client.im.v1.message.create(request)
@@ -658,14 +764,35 @@ def _send_feishu_message(receive_id: str, content: str) -> bool:
 async def _feishu_outbound_handler(msg):
     """Handle outbound messages destined for Feishu."""
     print(f"[nanobot-api] Dispatching Feishu message to {msg.chat_id}")
-    result = _send_feishu_message(msg.chat_id, msg.content)
+    # lark-oapi's send is a synchronous HTTPS call; run it on the executor
+    # so a slow send doesn't stall the event loop.
+    result = await asyncio.to_thread(_send_feishu_message, msg.chat_id, msg.content)
     print(f"[nanobot-api] Feishu send result: {result}")
 
 
+def _load_console_assets() -> tuple[bytes, bytes]:
+    """Read the console HTML and pre-compress it (runs off the event loop)."""
+    raw = (
+        CONSOLE_HTML.read_bytes() if CONSOLE_HTML.exists()
+        else b"<h1>Console HTML not found</h1>"
+    )
+    return raw, gzip.compress(raw, 6)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global agent, bus, viking, _config, SESSIONS_DIR
-    config = load_config()
+    global agent, bus, viking, _config, SESSIONS_DIR, _console_bytes, _console_gzip
+    # 3.12+: let fire-and-forget tasks (heartbeats, dispatcher, WS flushers)
+    # run synchronously until their first suspension instead of paying a
+    # full loop round-trip per create_task.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    # /health reports agent_ready=False until lifespan finishes, so overlap
+    # the independent startup steps instead of running them back to back.
+    # Console HTML read + gzip runs concurrently with config loading; both
+    # hit disk and neither depends on the other.
+    console_task = asyncio.create_task(asyncio.to_thread(_load_console_assets))
+    config = await asyncio.to_thread(load_config)
     _config = config
     SESSIONS_DIR = config.workspace_path / "sessions"
     bus = MessageBus()
@@ -686,19 +813,28 @@ async def lifespan(app: FastAPI):
         timezone=getattr(config.agents.defaults, 'timezone', None),
     )
     agent = AgentLoop(**agent_kwargs)
-    # Initialize Feishu client and start outbound message dispatcher
-    _init_feishu_client(config)
+    # Feishu init re-reads config.json from disk; overlap it with Viking
+    # worker startup below.
+    feishu_task = asyncio.create_task(asyncio.to_thread(_init_feishu_client, config))
 
     async def _outbound_dispatcher():
+        # The loop keeps only a weak ref to tasks, so hold each send here
+        # until it finishes — otherwise a task can be collected mid-flight
+        # and its exception never retrieved.
+        sends: set[asyncio.Task] = set()
         while True:
             try:
                 msg = await bus.consume_outbound()
                 if msg.channel == "feishu" and _feishu_client:
-                    await _feishu_outbound_handler(msg)
+                    # Fire-and-forget: bursty notifications send in parallel
+                    # on the thread pool instead of serializing behind one
+                    # slow HTTPS round-trip.
+                    t = asyncio.create_task(_feishu_outbound_handler(msg))
+                    sends.add(t)
+                    t.add_done_callback(sends.discard)
             except Exception as e:
                 logger.error(f"Outbound dispatch error: {e}")
 
-    _dispatcher_task = asyncio.create_task(_outbound_dispatcher())
     # Initialize OpenViking memory (worker thread handles all operations)
     if VIKING_AVAILABLE:
         try:
@@ -708,13 +844,18 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"OpenViking init failed (memory layer disabled): {e}")
             viking = None
+    _console_bytes, _console_gzip = await console_task
+    await feishu_task
+    # Dispatcher starts once the Feishu client is (possibly) available
+    _dispatcher_task = asyncio.create_task(_outbound_dispatcher())
     yield
     _dispatcher_task.cancel()
     if viking:
         viking.close()
 
 
-app = FastAPI(title="nanobot API", version="1.0.0", lifespan=lifespan)
+app = FastAPI(title="nanobot API", version="1.0.0", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
 
@@ -742,72 +883,148 @@ class SimpleResponse(BaseModel):
     emotion: str = "neutral"
 
 
+# Tiny TTL cache for retrieved context: identical questions (voice
+# commands, retries) skip the worker-thread hop for a minute. The bounded
+# timeout keeps a slow or hung Viking from stalling every chat turn.
+_MEMORY_CACHE: dict[str, tuple[float, str]] = {}
+_MEMORY_CACHE_MAX = 256
+_MEMORY_CACHE_TTL = 60.0
+_MEMORY_TIMEOUT = 0.5
+
+
 async def _augment_with_memory(message: str) -> str:
     """Prepend relevant Viking context to the user message."""
     if not viking or not viking.ready:
         return message
-    try:
-        context = await viking.retrieve_context(message, 3)
-        if context:
-            return f"[以下是从知识库中检索到的相关上下文，仅供参考]\n{context}\n[上下文结束]\n\n{message}"
-    except Exception as e:
-        logger.error(f"Memory augmentation failed: {e}")
+    now = time.monotonic()
+    cached = _MEMORY_CACHE.get(message)
+    if cached and now - cached[0] < _MEMORY_CACHE_TTL:
+        context = cached[1]
+    else:
+        try:
+            context = await asyncio.wait_for(
+                viking.retrieve_context(message, 3), _MEMORY_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Memory augmentation timed out, continuing without context")
+            return message
+        except Exception as e:
+            logger.error(f"Memory augmentation failed: {e}")
+            return message
+        if len(_MEMORY_CACHE) >= _MEMORY_CACHE_MAX:
+            _MEMORY_CACHE.clear()
+        _MEMORY_CACHE[message] = (now, context or "")
+    if context:
+        return f"[以下是从知识库中检索到的相关上下文，仅供参考]\n{context}\n[上下文结束]\n\n{message}"
     return message
 
 
 
+# Collapses newline runs and strips leading bullets / list numbering in one
+# pass; the old per-character replace loop copied the string up to 10 times.
+_TTS_CLEAN_RE = re.compile(r"\n+(?:[-*•·—] ?|\d+[.)、]\s*)?")
+
+# Cheap pre-test: does any newline start a bullet or numbered item? When it
+# doesn't, the full pattern can only collapse newline runs.
+_TTS_LIST_RE = re.compile(r"\n[-*•·—\d]")
+
+
 def _clean_for_tts(text: str) -> str:
-    clean = text.strip()
-    for ch in ["-", "*", "•", "·", "—"]:
-        clean = clean.replace(f"\n{ch} ", "\n")
-        clean = clean.replace(f"\n{ch}", "\n")
-    clean = re.sub(r'\n\d+[\.\)、]\s*', '\n', clean)
-    clean = re.sub(r'\n{2,}', '\n', clean).strip()
-    return clean
+    # Every cleanup rule anchors on a newline, so single-line replies (the
+    # common case for short chat turns) need only a strip.
+    if "\n" not in text:
+        return text.strip()
+    text = text.strip()
+    if _TTS_LIST_RE.search(text) is None:
+        # Plain paragraphs: collapse newline runs with C-level replace
+        # passes instead of per-match regex substitution.
+        while "\n\n" in text:
+            text = text.replace("\n\n", "\n")
+        return text
+    text = _TTS_CLEAN_RE.sub("\n", text)
+    # A bullet directly followed by a newline leaves "\n\n" behind (the
+    # replacement can't merge with the next run in the same pass).
+    while "\n\n" in text:
+        text = text.replace("\n\n", "\n")
+    return text.strip()
 
 
 # ---- Console UI ----
 
 @app.get("/", response_class=HTMLResponse)
-async def console_page():
-    if CONSOLE_HTML.exists():
-        return CONSOLE_HTML.read_text(encoding="utf-8")
-    return "<h1>Console HTML not found</h1>"
+async def console_page(request: Request):
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_console_gzip,
+            media_type="text/html",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(content=_console_bytes, media_type="text/html")
 
 
 # ---- Session API (for Console) ----
 
-@app.get("/api/sessions")
-async def list_sessions():
-    results = []
-    seen = set()
+# Parsed session stats keyed by file path; an entry is reused as long as
+# (st_mtime_ns, st_size) is unchanged, so steady-state Console polls cost
+# one scandir pass and re-parse only files that actually changed.
+_SESSION_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
+def _list_sessions_sync():
     # Scan both current and legacy session directories
-    dirs = [d for d in [SESSIONS_DIR, LEGACY_SESSIONS_DIR] if d and d.exists()]
-    all_files = []
-    for d in dirs:
-        for f in d.glob("*.jsonl"):
-            if f.stem not in seen:
-                seen.add(f.stem)
-                all_files.append(f)
-    for f in sorted(all_files, key=lambda p: p.stat().st_mtime, reverse=True):
-        name = f.stem
+    entries = []
+    seen = set()
+    for d in [SESSIONS_DIR, LEGACY_SESSIONS_DIR]:
+        if not (d and d.exists()):
+            continue
+        with os.scandir(d) as it:
+            for entry in it:
+                if not entry.name.endswith(".jsonl"):
+                    continue
+                name = entry.name[:-6]
+                if name not in seen:
+                    seen.add(name)
+                    entries.append((entry.path, name, entry.stat()))
+    results = []
+    for path, name, st in sorted(entries, key=lambda e: e[2].st_mtime, reverse=True):
+        cached = _SESSION_CACHE.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            results.append(cached[2])
+            continue
         msg_count = 0
         updated = None
         try:
-            with open(f, "r") as fh:
-                for line in fh:
-                    row = json.loads(line)
-                    if row.get("_type") == "metadata":
-                        updated = row.get("updated_at")
-                    elif row.get("role") in ("user", "assistant"):
-                        msg_count += 1
+            # Only two fields matter here: count roles with C-level substring
+            # scans (both writer spacings) and parse JSON solely for the
+            # latest metadata row, which sits near the tail.
+            raw = Path(path).read_bytes()
+            msg_count = (
+                raw.count(b'"role":"user"') + raw.count(b'"role": "user"')
+                + raw.count(b'"role":"assistant"') + raw.count(b'"role": "assistant"')
+            )
+            if b'"_type"' in raw:
+                for line in reversed(raw.splitlines()):
+                    if b'"_type":"metadata"' in line.replace(b" ", b""):
+                        try:
+                            updated = orjson.loads(line).get("updated_at")
+                        except orjson.JSONDecodeError:
+                            pass
+                        break
         except Exception:
             pass
         display = name.replace("feishu_", "Feishu: ").replace("api_", "API: ").replace("ws_", "WS: ").replace("cli_", "CLI: ")
-        results.append({"name": name, "display": display, "messages": msg_count, "updated": updated, "size": f.stat().st_size})
+        payload = {"name": name, "display": display, "messages": msg_count, "updated": updated, "size": st.st_size}
+        _SESSION_CACHE[path] = (st.st_mtime_ns, st.st_size, payload)
+        results.append(payload)
     return results
 
 
+@app.get("/api/sessions")
+async def list_sessions():
+    # Directory scan and per-file byte scans block; keep them off the loop.
+    return await asyncio.to_thread(_list_sessions_sync)
+
+
 def _find_session_file(name: str) -> Path | None:
     """Find a session file in current or legacy directory."""
     for d in [SESSIONS_DIR, LEGACY_SESSIONS_DIR]:
@@ -818,22 +1035,26 @@ def _find_session_file(name: str) -> Path | None:
     return None
 
 
+def _read_session_sync(fpath: Path) -> list[dict]:
+    messages = []
+    for line in fpath.read_bytes().splitlines():
+        if not line:
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if row.get("_type") != "metadata":
+            messages.append(row)
+    return messages
+
+
 @app.get("/api/sessions/{name}")
 async def get_session(name: str):
     fpath = _find_session_file(name)
     if not fpath:
         raise HTTPException(404, "Session not found")
-    messages = []
-    with open(fpath, "r") as f:
-        for line in f:
-            try:
-                row = json.loads(line)
-                if row.get("_type") == "metadata":
-                    continue
-                messages.append(row)
-            except Exception:
-                pass
-    return messages
+    return await asyncio.to_thread(_read_session_sync, fpath)
 
 
 @app.delete("/api/sessions/{name}")
@@ -841,21 +1062,38 @@ async def delete_session(name: str):
     fpath = _find_session_file(name)
     if not fpath:
         raise HTTPException(404, "Session not found")
-    fpath.unlink()
+    await asyncio.to_thread(fpath.unlink)
     return {"status": "ok", "deleted": name}
 
 
 # ---- Chat Endpoints ----
 
-@app.post("/v1/chat/completions")
-async def chat_completions(req: ChatRequest):
+@app.post("/v1/chat/completions", openapi_extra={
+    "requestBody": {"content": {"application/json": {
+        "schema": ChatRequest.model_json_schema(),
+    }}},
+})
+async def chat_completions(request: Request):
+    # Only the last user message is used, so read the raw body instead of
+    # paying Pydantic validation for every message in a long history.
+    # ChatRequest still documents the accepted schema (openapi_extra above).
     if not agent:
         raise HTTPException(503, "Agent not ready")
-    user_msg = ""
-    for m in reversed(req.messages):
-        if m.role == "user":
-            user_msg = m.content
-            break
+    try:
+        req = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(400, "Invalid JSON body")
+    if not isinstance(req, dict):
+        raise HTTPException(400, "Request body must be a JSON object")
+    msgs = req.get("messages") or []
+    if not isinstance(msgs, list):
+        raise HTTPException(400, "messages must be a list")
+    user_msg = next(
+        (m.get("content") for m in reversed(msgs) if isinstance(m, dict) and m.get("role") == "user"),
+        "",
+    )
+    if not isinstance(user_msg, str):
+        raise HTTPException(400, "Message content must be a string")
     if not user_msg:
         raise HTTPException(400, "No user message found")
     session_key = f"api:{uuid.uuid4().hex[:8]}"
@@ -891,23 +1129,87 @@ async def simple_chat(req: SimpleRequest):
 
 # ---- WebSocket ----
 
+# Streaming events are coalesced into "batch" frames so a burst of
+# token/tool events costs one encode + one socket write instead of one
+# syscall each. The window bounds added latency; the cap bounds frame size.
+_WS_BATCH_WINDOW = 0.005
+_WS_BATCH_MAX = 32
+
+# MessagePack binary framing (optional) — clients negotiate it via the
+# "msgpack" WebSocket subprotocol; JSON text frames remain the default.
+try:
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+
+
+async def _ws_send(ws: WebSocket, payload: dict) -> None:
+    """Send a JSON payload as a text frame encoded with orjson.
+
+    Starlette's send_json goes through stdlib json.dumps; orjson is several
+    times faster, which adds up on chatty streaming connections.
+    """
+    await ws.send_text(orjson.dumps(payload).decode())
+
+
 @app.websocket("/ws/chat")
 async def websocket_chat(ws: WebSocket):
-    await ws.accept()
+    # Clients may offer "msgpack" via Sec-WebSocket-Protocol to switch the
+    # connection to binary MessagePack frames — smaller payloads and no
+    # per-frame UTF-8 validation. JSON text frames stay the default so
+    # browser clients keep working unchanged.
+    offered = ws.headers.get("sec-websocket-protocol", "")
+    use_msgpack = _msgpack is not None and "msgpack" in {
+        p.strip() for p in offered.split(",")
+    }
+    if use_msgpack:
+        await ws.accept(subprotocol="msgpack")
+
+        async def _send(payload: dict) -> None:
+            await ws.send_bytes(_msgpack.packb(payload, use_bin_type=True))
+
+        async def _receive() -> dict:
+            return _msgpack.unpackb(await ws.receive_bytes(), raw=False)
+    else:
+        await ws.accept()
+
+        async def _send(payload: dict) -> None:
+            await _ws_send(ws, payload)
+
+        async def _receive() -> dict:
+            return orjson.loads(await ws.receive_text())
+
+    # One heartbeat task for the whole connection, gated on a processing
+    # flag, instead of a create_task/cancel pair per user message.
+    processing = asyncio.Event()
+
+    async def _heartbeat():
+        """Send periodic heartbeats while the agent is processing."""
+        while True:
+            await processing.wait()
+            await asyncio.sleep(15)
+            if processing.is_set():
+                try:
+                    await _send({"type": "heartbeat", "timestamp": time.time()})
+                except Exception:
+                    pass
+
+    hb_task = asyncio.create_task(_heartbeat())
     try:
         while True:
-            raw = await ws.receive_text()
             try:
-                data = json.loads(raw)
-            except json.JSONDecodeError:
-                await ws.send_json({"type": "error", "message": "Invalid JSON"})
+                data = await _receive()
+            except ValueError:
+                # orjson.JSONDecodeError and msgpack unpack errors both
+                # derive from ValueError
+                await _send({"type": "error", "message": "Invalid JSON"})
                 continue
             message = data.get("message", "").strip()
             if not message:
-                await ws.send_json({"type": "error", "message": "Empty message"})
+                await _send({"type": "error", "message": "Empty message"})
                 continue
             if not agent:
-                await ws.send_json({"type": "error", "message": "Agent not ready"})
+                await _send({"type": "error", "message": "Agent not ready"})
                 continue
             session = data.get("session", "ws:default")
             constraint = data.get("constraint", None)
@@ -916,35 +1218,39 @@ async def websocket_chat(ws: WebSocket):
             augmented = await _augment_with_memory(message) if use_kb else message
             content = f"{augmented}\n\n（回复要求：{constraint}）" if constraint else augmented
 
+            event_q: asyncio.Queue = asyncio.Queue()
+
+            async def _flush_events():
+                """Drain queued events and send them as coalesced batches."""
+                while True:
+                    batch = [await event_q.get()]
+                    while len(batch) < _WS_BATCH_MAX:
+                        try:
+                            batch.append(await asyncio.wait_for(event_q.get(), _WS_BATCH_WINDOW))
+                        except asyncio.TimeoutError:
+                            break
+                    try:
+                        if len(batch) == 1:
+                            await _send(batch[0])
+                        else:
+                            await _send({"type": "batch", "events": batch})
+                    except Exception:
+                        pass
+                    for _ in batch:
+                        event_q.task_done()
+
             async def _on_progress(text: str, tool_hint: bool = False):
-                try:
-                    event = {"type": "tool_call" if tool_hint else "thinking", "content": text}
-                    await ws.send_json(_enrich_event(event))
-                except Exception:
-                    pass
+                event = {"type": "tool_call" if tool_hint else "thinking", "content": text}
+                event_q.put_nowait(_enrich_event(event))
 
             async def _on_stream(delta: str):
-                try:
-                    await ws.send_json({"type": "stream", "delta": delta})
-                except Exception:
-                    pass
+                event_q.put_nowait({"type": "stream", "delta": delta})
 
             async def _on_stream_end(*, resuming: bool = False):
-                try:
-                    await ws.send_json({"type": "stream_end", "resuming": resuming})
-                except Exception:
-                    pass
-
-            async def heartbeat():
-                """Send periodic heartbeat while agent is processing."""
-                try:
-                    while True:
-                        await asyncio.sleep(15)
-                        await ws.send_json({"type": "heartbeat", "timestamp": time.time()})
-                except (Exception, asyncio.CancelledError):
-                    pass
+                event_q.put_nowait({"type": "stream_end", "resuming": resuming})
 
-            hb_task = asyncio.create_task(heartbeat())
+            flush_task = asyncio.create_task(_flush_events())
+            processing.set()
             try:
                 result = await agent.process_direct(
                     content=content, session_key=session, channel="ws", chat_id=session,
@@ -955,7 +1261,9 @@ async def websocket_chat(ws: WebSocket):
                 response = result.content if result else ""
                 clean = _clean_for_tts(response)
                 emotion = _detect_emotion(clean)
-                await ws.send_json({
+                # Deliver any queued events before the final frame.
+                await event_q.join()
+                await _send({
                     "type": "final",
                     "content": clean,
                     "emotion": emotion,
@@ -963,11 +1271,14 @@ async def websocket_chat(ws: WebSocket):
                     "timestamp": time.time(),
                 })
             except Exception as e:
-                await ws.send_json({"type": "error", "message": str(e)})
+                await _send({"type": "error", "message": str(e)})
             finally:
-                hb_task.cancel()
+                processing.clear()
+                flush_task.cancel()
     except WebSocketDisconnect:
         pass
+    finally:
+        hb_task.cancel()
 
 
 # ---- Viking Knowledge Base API ----
@@ -979,24 +1290,27 @@ async def viking_status():
     return {"status": "ok", "ready": True}
 
 
+def get_viking() -> VikingService:
+    """Dependency: the ready Viking service, or 503 when unavailable."""
+    if not viking or not viking.ready:
+        raise HTTPException(503, "OpenViking not initialized")
+    return viking
+
+
 class VikingSearchRequest(BaseModel):
     query: str
     limit: int = 5
 
 
 @app.post("/api/viking/search")
-async def viking_search(req: VikingSearchRequest):
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
-    result = await viking.search(req.query, req.limit)
+async def viking_search(req: VikingSearchRequest, v: VikingService = Depends(get_viking)):
+    result = await v.search(req.query, req.limit)
     return {"result": result}
 
 
 @app.post("/api/viking/find")
-async def viking_find(req: VikingSearchRequest):
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
-    result = await viking.find(req.query, req.limit)
+async def viking_find(req: VikingSearchRequest, v: VikingService = Depends(get_viking)):
+    result = await v.find(req.query, req.limit)
     return {"result": result}
 
 
@@ -1005,41 +1319,34 @@ class VikingAddRequest(BaseModel):
 
 
 @app.post("/api/viking/add")
-async def viking_add(req: VikingAddRequest):
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
-    result = await viking.add_resource(req.path)
+async def viking_add(req: VikingAddRequest, v: VikingService = Depends(get_viking)):
+    result = await v.add_resource(req.path)
     return {"result": result}
 
 
 @app.get("/api/viking/ls")
-async def viking_ls(uri: str = "viking://resources/", mock_no_viking: int = 0):
+async def viking_ls(uri: str = "viking://resources/", mock_no_viking: int = 0,
+                    v: VikingService = Depends(get_viking)):
     """List resources. Pass ?mock_no_viking=1 to simulate Viking-not-installed (for onboarding test)."""
     if mock_no_viking:
         raise HTTPException(503, "OpenViking not initialized (mock)")
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
-    result = await viking.ls(uri)
+    result = await v.ls(uri)
     return {"result": result}
 
 
 @app.get("/api/viking/sessions")
-async def viking_sessions():
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
-    result = await viking.list_sessions()
+async def viking_sessions(v: VikingService = Depends(get_viking)):
+    result = await v.list_sessions()
     return {"result": result}
 
 
 @app.post("/api/viking/upload")
-async def viking_upload(file: UploadFile = File(...)):
+async def viking_upload(file: UploadFile = File(...), v: VikingService = Depends(get_viking)):
     """Upload a file to Viking knowledge base.
 
     Saves the uploaded file to a temp directory under Viking's data dir,
     then calls add_resource to import it.
     """
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
     import tempfile
     # Use a persistent staging dir so Viking can still read after add_resource
     staging_dir = Path(os.path.expanduser("~/.nanobot/viking_uploads"))
@@ -1048,8 +1355,8 @@ async def viking_upload(file: UploadFile = File(...)):
     dest = staging_dir / safe_name
     try:
         content = await file.read()
-        dest.write_bytes(content)
-        result = await viking.add_resource(str(dest))
+        await asyncio.to_thread(dest.write_bytes, content)
+        result = await v.add_resource(str(dest))
         return {"result": result, "filename": safe_name}
     except Exception as e:
         raise HTTPException(500, f"Upload failed: {e}")
@@ -1060,35 +1367,110 @@ class VikingDeleteRequest(BaseModel):
 
 
 @app.post("/api/viking/delete")
-async def viking_delete(req: VikingDeleteRequest):
+async def viking_delete(req: VikingDeleteRequest, v: VikingService = Depends(get_viking)):
     """Delete a resource from Viking knowledge base by URI."""
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
-    result = await viking.delete_resource(req.uri)
+    result = await v.delete_resource(req.uri)
     return {"result": result}
 
 
 @app.get("/api/viking/get")
-async def viking_get(uri: str, mock_no_viking: int = 0):
+async def viking_get(uri: str, mock_no_viking: int = 0,
+                     v: VikingService = Depends(get_viking)):
     """Read full content of a Viking resource by URI."""
     if mock_no_viking:
         raise HTTPException(503, "OpenViking not available (mock)")
-    if not viking or not viking.ready:
-        raise HTTPException(503, "OpenViking not initialized")
-    result = await viking.read_resource(uri)
+    result = await v.read_resource(uri)
     return {"ok": True, "content": result}
 
 
 # ---- Config / Tools / Skills API ----
 
 CONFIG_PATH = Path.home() / ".nanobot" / "config.json"
+
+# (mtime_ns, parsed) cache of raw config.json for the editing endpoints;
+# callers get a copy since they mutate before writing back.
+_RAW_CONFIG_CACHE: tuple[int, dict] | None = None
+
+
+def _read_raw_config() -> dict:
+    global _RAW_CONFIG_CACHE
+    st = os.stat(CONFIG_PATH)
+    cached = _RAW_CONFIG_CACHE
+    if cached is None or cached[0] != st.st_mtime_ns:
+        cached = (st.st_mtime_ns, orjson.loads(CONFIG_PATH.read_bytes()))
+        _RAW_CONFIG_CACHE = cached
+    return copy.deepcopy(cached[1])
+
+
+def _atomic_write_bytes(fpath: Path, data: bytes) -> None:
+    """Write to a temp file, fsync, then os.replace so readers never see a
+    torn file even if the process dies mid-write."""
+    tmp = fpath.with_suffix(fpath.suffix + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, fpath)
+
+
+def _write_raw_config(raw: dict) -> None:
+    global _RAW_CONFIG_CACHE
+    _atomic_write_bytes(CONFIG_PATH, orjson.dumps(raw, option=orjson.OPT_INDENT_2))
+    _RAW_CONFIG_CACHE = None
 WORKSPACE_DIR = Path.home() / ".nanobot" / "workspace"
 SKILLS_DIR = WORKSPACE_DIR / "skills"
 
 
-@app.get("/api/config")
-async def get_config():
-    """Get current agent configuration (model, tools, skills, channels, providers)."""
+# SKILL.md frontmatter lives at the top of the file; anchor to line starts
+# and only scan the head so large skill bodies aren't walked per poll.
+_SKILL_DESC_RE = re.compile(r"^description:\s*(.+)$", re.MULTILINE)
+
+# (path -> (mtime_ns, text)) cache for the skill/prompt/memory reads below;
+# unchanged files are served from memory between Console polls.
+_FILE_CACHE: dict[str, tuple[int, str]] = {}
+
+
+def _read_text_cached(fpath: Path) -> str | None:
+    try:
+        st = fpath.stat()
+    except OSError:
+        return None
+    key = str(fpath)
+    cached = _FILE_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns:
+        return cached[1]
+    text = fpath.read_text()
+    _FILE_CACHE[key] = (st.st_mtime_ns, text)
+    return text
+
+
+# (path -> (mtime_ns, info)) cache of parsed SKILL.md entries; the
+# description regex reruns only when a skill file actually changes.
+_SKILL_CACHE: dict[str, tuple[int, dict]] = {}
+
+
+def _read_skill_cached(skill_name: str) -> dict:
+    skill_md = SKILLS_DIR / skill_name / "SKILL.md"
+    try:
+        st = skill_md.stat()
+    except OSError:
+        return {"name": skill_name, "description": ""}
+    key = str(skill_md)
+    cached = _SKILL_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns:
+        return cached[1]
+    text = skill_md.read_text()
+    info = {"name": skill_name, "description": "", "content": text}
+    fm_match = _SKILL_DESC_RE.search(text[:2048])
+    if fm_match:
+        info["description"] = fm_match.group(1).strip()
+    _SKILL_CACHE[key] = (st.st_mtime_ns, info)
+    return info
+
+
+def _build_config_sync():
     config_data = {}
     if _config:
         config_data = {
@@ -1131,32 +1513,53 @@ async def get_config():
     # Skills
     skills = []
     if SKILLS_DIR.exists():
-        for skill_dir in sorted(SKILLS_DIR.iterdir()):
-            if skill_dir.is_dir():
-                skill_md = skill_dir / "SKILL.md"
-                skill_info = {"name": skill_dir.name, "description": ""}
-                if skill_md.exists():
-                    text = skill_md.read_text()
-                    fm_match = re.search(r"description:\s*(.+)", text)
-                    if fm_match:
-                        skill_info["description"] = fm_match.group(1).strip()
-                    skill_info["content"] = text
-                skills.append(skill_info)
+        with os.scandir(SKILLS_DIR) as it:
+            skill_dirs = sorted(e.name for e in it if e.is_dir())
+        for skill_name in skill_dirs:
+            skills.append(_read_skill_cached(skill_name))
     config_data["skills"] = skills
     # System prompt files
     prompt_files = {}
     for fname in ["SOUL.md", "AGENTS.md", "USER.md"]:
-        fpath = WORKSPACE_DIR / fname
-        if fpath.exists():
-            prompt_files[fname] = fpath.read_text()
+        text = _read_text_cached(WORKSPACE_DIR / fname)
+        if text is not None:
+            prompt_files[fname] = text
     config_data["prompt_files"] = prompt_files
     # Memory
-    memory_file = WORKSPACE_DIR / "memory" / "MEMORY.md"
-    if memory_file.exists():
-        config_data["memory"] = memory_file.read_text()
+    memory = _read_text_cached(WORKSPACE_DIR / "memory" / "MEMORY.md")
+    if memory is not None:
+        config_data["memory"] = memory
     return config_data
 
 
+def _negotiate(payload, request: Request):
+    """Return MessagePack for clients that ask for it via Accept; plain
+    payloads fall through to the default ORJSONResponse."""
+    if _msgpack is not None and "application/msgpack" in request.headers.get("accept", ""):
+        return Response(
+            _msgpack.packb(payload, use_bin_type=True),
+            media_type="application/msgpack",
+        )
+    return payload
+
+
+@app.get("/api/config")
+async def get_config(request: Request):
+    """Get current agent configuration (model, tools, skills, channels, providers)."""
+    data = await asyncio.to_thread(_build_config_sync)
+    negotiated = _negotiate(data, request)
+    if isinstance(negotiated, Response):
+        return negotiated
+    # Content-derived weak ETag: the payload mixes many files plus live
+    # tool state, so hashing the serialized bytes is the only tag that
+    # can't go stale. Unchanged polls get a 0-byte 304.
+    body = orjson.dumps(data)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
 class ConfigUpdateRequest(BaseModel):
     model: str | None = None
     temperature: float | None = None
@@ -1167,40 +1570,59 @@ class ConfigUpdateRequest(BaseModel):
     send_tool_hints: bool | None = None
 
 
-@app.post("/api/config")
-async def update_config(req: ConfigUpdateRequest):
+# request field -> (config section, camelCase key, expected type) for
+# /api/config updates; types mirror ConfigUpdateRequest so a mistyped
+# value can't reach config.json and break load_config() at next startup.
+_CONFIG_FIELD_MAP = {
+    "model": ("defaults", "model", str),
+    "temperature": ("defaults", "temperature", (int, float)),
+    "max_tokens": ("defaults", "maxTokens", int),
+    "max_tool_iterations": ("defaults", "maxToolIterations", int),
+    "context_window_tokens": ("defaults", "contextWindowTokens", int),
+    "send_progress": ("channels", "sendProgress", bool),
+    "send_tool_hints": ("channels", "sendToolHints", bool),
+}
+
+
+@app.post("/api/config", openapi_extra={
+    "requestBody": {"content": {"application/json": {
+        "schema": ConfigUpdateRequest.model_json_schema(),
+    }}},
+})
+async def update_config(request: Request):
     """Update agent configuration. Requires service restart to take effect."""
+    # Raw orjson decode instead of Pydantic validation — same pattern as
+    # chat_completions; ConfigUpdateRequest documents the schema above.
     if not CONFIG_PATH.exists():
         raise HTTPException(404, "Config file not found")
     try:
-        raw = json.loads(CONFIG_PATH.read_text())
-        defaults = raw.setdefault("agents", {}).setdefault("defaults", {})
-        channels = raw.setdefault("channels", {})
+        req = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(400, "Invalid JSON body")
+    if not isinstance(req, dict):
+        raise HTTPException(400, "Request body must be a JSON object")
+    for field, (_section, _key, typ) in _CONFIG_FIELD_MAP.items():
+        v = req.get(field)
+        # bool subclasses int, so True would slip into the numeric fields
+        if v is not None and (not isinstance(v, typ) or (isinstance(v, bool) and typ is not bool)):
+            raise HTTPException(400, f"Invalid type for {field}")
+    try:
+        raw = await asyncio.to_thread(_read_raw_config)
+        sections = {
+            "defaults": raw.setdefault("agents", {}).setdefault("defaults", {}),
+            "channels": raw.setdefault("channels", {}),
+        }
         changed = []
-        if req.model is not None:
-            defaults["model"] = req.model
-            changed.append(f"model={req.model}")
-        if req.temperature is not None:
-            defaults["temperature"] = req.temperature
-            changed.append(f"temperature={req.temperature}")
-        if req.max_tokens is not None:
-            defaults["maxTokens"] = req.max_tokens
-            changed.append(f"maxTokens={req.max_tokens}")
-        if req.max_tool_iterations is not None:
-            defaults["maxToolIterations"] = req.max_tool_iterations
-            changed.append(f"maxToolIterations={req.max_tool_iterations}")
-        if req.context_window_tokens is not None:
-            defaults["contextWindowTokens"] = req.context_window_tokens
-            changed.append(f"contextWindowTokens={req.context_window_tokens}")
-        if req.send_progress is not None:
-            channels["sendProgress"] = req.send_progress
-            changed.append(f"sendProgress={req.send_progress}")
-        if req.send_tool_hints is not None:
-            channels["sendToolHints"] = req.send_tool_hints
-            changed.append(f"sendToolHints={req.send_tool_hints}")
+        for field, (section, key, _typ) in _CONFIG_FIELD_MAP.items():
+            v = req.get(field)
+            if v is not None:
+                sections[section][key] = v
+                changed.append(f"{key}={v}")
         if not changed:
             return {"status": "no changes"}
-        CONFIG_PATH.write_text(json.dumps(raw, indent=2, ensure_ascii=False))
+        # orjson emits UTF-8 without ASCII escaping; write off the loop so a
+        # slow fsync doesn't stall other requests.
+        await asyncio.to_thread(_write_raw_config, raw)
         return {"status": "updated", "changed": changed}
     except Exception as e:
         raise HTTPException(500, f"Failed to update config: {e}")
@@ -1218,7 +1640,7 @@ async def update_provider(req: ProviderUpdateRequest):
     if not CONFIG_PATH.exists():
         raise HTTPException(404, "Config file not found")
     try:
-        raw = json.loads(CONFIG_PATH.read_text())
+        raw = await asyncio.to_thread(_read_raw_config)
         p = raw.setdefault("providers", {}).setdefault(req.name, {})
         changed = []
         if req.api_key is not None:
@@ -1229,7 +1651,7 @@ async def update_provider(req: ProviderUpdateRequest):
             changed.append("apiBase")
         if not changed:
             return {"status": "no changes"}
-        CONFIG_PATH.write_text(json.dumps(raw, indent=2, ensure_ascii=False))
+        await asyncio.to_thread(_write_raw_config, raw)
         return {"status": "updated", "provider": req.name, "changed": changed}
     except Exception as e:
         raise HTTPException(500, f"Failed to update provider: {e}")
@@ -1240,18 +1662,36 @@ class PromptFileUpdateRequest(BaseModel):
     content: str
 
 
-@app.post("/api/config/prompt")
-async def update_prompt_file(req: PromptFileUpdateRequest):
+_ALLOWED_PROMPT_FILES = frozenset({"SOUL.md", "AGENTS.md", "USER.md"})
+
+
+@app.post("/api/config/prompt", openapi_extra={
+    "requestBody": {"content": {"application/json": {
+        "schema": PromptFileUpdateRequest.model_json_schema(),
+    }}},
+})
+async def update_prompt_file(request: Request):
     """Update a system prompt file (SOUL.md, AGENTS.md, USER.md)."""
-    allowed = {"SOUL.md", "AGENTS.md", "USER.md"}
-    if req.filename not in allowed:
-        raise HTTPException(400, f"Only {allowed} can be updated")
-    fpath = WORKSPACE_DIR / req.filename
     try:
-        fpath.write_text(req.content)
-        return {"status": "updated", "file": req.filename, "size": len(req.content)}
+        req = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(400, "Invalid JSON body")
+    if not isinstance(req, dict):
+        raise HTTPException(400, "Request body must be a JSON object")
+    filename = req.get("filename", "")
+    content = req.get("content", "")
+    if not isinstance(content, str):
+        raise HTTPException(400, "content must be a string")
+    if not isinstance(filename, str) or filename not in _ALLOWED_PROMPT_FILES:
+        raise HTTPException(400, f"Only {set(_ALLOWED_PROMPT_FILES)} can be updated")
+    fpath = WORKSPACE_DIR / filename
+    payload = content.encode()
+    try:
+        await asyncio.to_thread(_atomic_write_bytes, fpath, payload)
+        # size reports bytes written, not code points
+        return {"status": "updated", "file": filename, "size": len(payload)}
     except Exception as e:
-        raise HTTPException(500, f"Failed to write {req.filename}: {e}")
+        raise HTTPException(500, f"Failed to write {filename}: {e}")
 
 
 # ---- Cron API ----
@@ -1278,9 +1718,8 @@ def _write_cron_jobs(jobs: list[dict]) -> None:
     """Atomically overwrite jobs.json with updated job list."""
     p = _cron_jobs_path()
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(
-        json.dumps({"version": 1, "jobs": jobs}, indent=2, ensure_ascii=False),
-        encoding="utf-8",
+    _atomic_write_bytes(
+        p, json.dumps({"version": 1, "jobs": jobs}, indent=2, ensure_ascii=False).encode()
     )
 
 
@@ -1539,21 +1978,54 @@ async def delete_system_cron(index: int):
         raise HTTPException(500, str(e))
 
 
+# The health payload only has four possible shapes; pre-serialize them all
+# so the most-polled endpoint does a tuple lookup instead of an encode.
+_HEALTH_BYTES = {
+    (agent_ready, viking_ready): orjson.dumps(
+        {"status": "ok", "agent_ready": agent_ready, "viking_ready": viking_ready}
+    )
+    for agent_ready in (False, True)
+    for viking_ready in (False, True)
+}
+_HEALTH_MSGPACK = {
+    key: _msgpack.packb(orjson.loads(body), use_bin_type=True)
+    for key, body in _HEALTH_BYTES.items()
+} if _msgpack is not None else {}
+
+
 @app.get("/health")
-async def health(mock_no_viking: int = 0):
+async def health(request: Request, mock_no_viking: int = 0):
     """Health check. Pass ?mock_no_viking=1 to test onboarding UI (Viking OFF state)."""
-    return {
-        "status": "ok",
-        "agent_ready": agent is not None,
-        "viking_ready": (viking is not None and viking.ready) if not mock_no_viking else False,
-    }
+    key = (
+        agent is not None,
+        (viking is not None and viking.ready) if not mock_no_viking else False,
+    )
+    if _HEALTH_MSGPACK and "application/msgpack" in request.headers.get("accept", ""):
+        return Response(_HEALTH_MSGPACK[key], media_type="application/msgpack")
+    return Response(_HEALTH_BYTES[key], media_type="application/json")
+
+
+# Static payload: serialize once, let clients cache it.
+_MODELS_BYTES = orjson.dumps(
+    {"object": "list", "data": [{"id": "nanobot", "object": "model", "owned_by": "local"}]}
+)
 
 
 @app.get("/v1/models")
 async def list_models():
-    return {"object": "list", "data": [{"id": "nanobot", "object": "model", "owned_by": "local"}]}
+    return Response(
+        _MODELS_BYTES,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=18790)
+    # WEB_CONCURRENCY > 1 forks one process per worker; lifespan runs in each,
+    # so agent/bus/viking are per-worker. WS connections are worker-local.
+    uvicorn.run(
+        "nanobot_web_console.server:app",
+        host="0.0.0.0", port=18790, loop="auto", http="auto",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
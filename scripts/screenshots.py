@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Capture README screenshots of the console UI with Playwright.
+
+Serves nanobot_web_console/index.html from a local HTTP server, mocks all
+/api/** endpoints with canned data (no running nanobot needed), and walks
+the UI through its main screens:
+
+  01-session-dark.png      session list + chat history (dark theme)
+  02-session-light.png     same screen, light theme
+  03-livechat-tools.png    live chat with tool-call events
+  04-livechat-expanded.png tool-call events expanded
+  05-viking-browser.png    knowledge base browser
+  06-viking-search.png     knowledge base search results
+  07-settings.png          settings panel
+  08-mobile.png            mobile layout (390x844)
+
+Usage:
+    pip install playwright aiohttp && playwright install chromium
+    python scripts/screenshots.py
+"""
+
+import asyncio
+import json
+import os
+import re
+
+from aiohttp import web
+from playwright.async_api import async_playwright
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PKG_DIR = os.path.join(ROOT, "nanobot_web_console")
+SCREENSHOTS_DIR = os.path.join(ROOT, "screenshots")
+PORT = 18791
+
+# ---------------------------------------------------------------------------
+# Mock API data — shapes mirror nanobot_web_console/server.py responses
+# ---------------------------------------------------------------------------
+
+MOCK_SESSIONS = [
+    {"name": "feishu_oc_demo01", "display": "Feishu: oc_demo01", "messages": 42, "updated": "2025-04-02T09:15:00", "size": 18234},
+    {"name": "api_weather", "display": "API: weather", "messages": 12, "updated": "2025-04-01T21:40:00", "size": 5120},
+    {"name": "ws_console", "display": "WS: console", "messages": 8, "updated": "2025-04-01T18:02:00", "size": 3044},
+    {"name": "cli_default", "display": "CLI: default", "messages": 31, "updated": "2025-03-30T11:27:00", "size": 12880},
+]
+
+MOCK_MESSAGES = [
+    {"role": "user", "content": "帮我看看明天北京的天气怎么样？", "timestamp": "2025-04-01T21:38:00"},
+    {"role": "assistant", "content": "明天北京晴，气温 12°C ~ 24°C，微风。适合户外活动，不过早晚温差较大，记得添件外套。", "timestamp": "2025-04-01T21:38:20"},
+    {"role": "user", "content": "那帮我定个早上 7 点的提醒，出门前看一眼穿什么", "timestamp": "2025-04-01T21:39:00"},
+    {"role": "assistant", "content": "好的，已创建每日 7:00 的提醒任务：**出门前查看天气和穿衣建议**。明早会准时通知你。", "timestamp": "2025-04-01T21:39:30"},
+]
+
+MOCK_CONFIG = {
+    "model": "anthropic/claude-sonnet-4",
+    "max_tokens": 8192,
+    "temperature": 0.7,
+    "max_tool_iterations": 20,
+    "context_window_tokens": 131072,
+    "provider": "anthropic",
+    "workspace": "~/.nanobot/workspace",
+    "channels": {"send_progress": True, "send_tool_hints": True},
+    "providers": [
+        {"name": "anthropic", "api_key": "sk-ant-****", "api_base": ""},
+        {"name": "openai", "api_key": "", "api_base": ""},
+    ],
+    "tools": [
+        {"name": "web_search", "description": "Search the web for current information", "parameters": {}},
+        {"name": "exec", "description": "Run a shell command in the workspace", "parameters": {}},
+        {"name": "read_file", "description": "Read a file from the workspace", "parameters": {}},
+        {"name": "write_file", "description": "Write a file to the workspace", "parameters": {}},
+        {"name": "cron", "description": "Schedule reminders and recurring jobs", "parameters": {}},
+        {"name": "viking_search", "description": "Search the OpenViking knowledge base", "parameters": {}},
+    ],
+    "skills": [
+        {"name": "daily-briefing", "description": "Morning news and weather summary"},
+        {"name": "code-review", "description": "Review diffs and suggest improvements"},
+    ],
+    "prompt_files": {
+        "SOUL.md": "# Soul\n\nYou are nanobot, a warm and capable personal assistant.",
+        "AGENTS.md": "# Agents\n\nPrefer concise answers. Use tools when they help.",
+    },
+}
+
+MOCK_HEALTH = {"status": "ok", "agent_ready": True, "viking_ready": True}
+
+MOCK_VIKING_STATUS = {"status": "ok", "ready": True}
+
+MOCK_VIKING_LS = {
+    "result": {
+        "ok": True,
+        "result": [
+            {"uri": "viking://resources/notes/", "isDir": True, "size": 0, "abstract": "个人笔记"},
+            {"uri": "viking://resources/nanobot-guide.md", "isDir": False, "size": 18342, "abstract": "nanobot 使用指南：安装、配置、频道接入与技能编写。"},
+            {"uri": "viking://resources/team-handbook.pdf", "isDir": False, "size": 204800, "abstract": "团队手册：协作流程、值班安排与发布清单。"},
+            {"uri": "viking://resources/recipes.md", "isDir": False, "size": 9216, "abstract": "家常菜谱合集，按食材分类。"},
+        ],
+    }
+}
+
+MOCK_VIKING_SEARCH = {
+    "result": {
+        "ok": True,
+        "result": {
+            "memories": [],
+            "skills": [],
+            "resources": [
+                {"uri": "viking://resources/nanobot-guide.md", "content": "配置 Feishu 频道需要在 config.json 的 channels.feishu 下填写 appId 和 appSecret……", "score": 0.91, "context_type": "resource"},
+                {"uri": "viking://resources/team-handbook.pdf", "content": "发布前检查清单：跑通 CI、更新 CHANGELOG、通知值班同学……", "score": 0.64, "context_type": "resource"},
+            ],
+            "total": 2,
+        },
+    }
+}
+
+MOCK_CRON_JOBS = [
+    {
+        "id": "a1b2c3d4", "name": "morning-briefing", "enabled": True,
+        "schedule": {"kind": "cron", "expr": "0 7 * * *", "every_ms": None, "at_ms": None, "tz": "Asia/Shanghai"},
+        "payload": {"message": "早上好，播报今天的天气和日程", "deliver": True, "channel": "feishu", "to": "oc_demo01"},
+        "state": {"next_run_at_ms": 1743555600000, "last_run_at_ms": 1743469200000, "last_status": "ok", "last_error": None},
+        "delete_after_run": False, "created_at_ms": 1740000000000,
+    },
+]
+
+
+def _body(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+# Compiled dispatch table: (pattern, {method: body bytes}). Walked in order,
+# hottest routes first — one regex hit + one dict lookup per intercepted
+# request instead of a chain of substring checks. The mocks are immutable,
+# so each payload is serialized exactly once at import time.
+ROUTES = [
+    (re.compile(r"/api/sessions/[^/?]+"), {"GET": _body(MOCK_MESSAGES)}),
+    (re.compile(r"/api/sessions"), {"GET": _body(MOCK_SESSIONS)}),
+    (re.compile(r"/health"), {"GET": _body(MOCK_HEALTH)}),
+    (re.compile(r"/api/viking/status"), {"GET": _body(MOCK_VIKING_STATUS)}),
+    (re.compile(r"/api/viking/ls"), {"GET": _body(MOCK_VIKING_LS)}),
+    (re.compile(r"/api/viking/(search|find)"), {"POST": _body(MOCK_VIKING_SEARCH)}),
+    (re.compile(r"/api/config"), {"GET": _body(MOCK_CONFIG), "POST": _body({"status": "updated", "changed": []})}),
+    (re.compile(r"/api/cron/jobs"), {"GET": _body(MOCK_CRON_JOBS)}),
+    (re.compile(r"/api/cron/system"), {"GET": _body({"entries": []})}),
+]
+
+EMPTY_BODY = _body({})
+
+
+async def mock_route(route, request):
+    """Fulfill intercepted /api/** and /health requests with mock data."""
+    url = request.url
+    for pattern, methods in ROUTES:
+        if pattern.search(url):
+            body = methods.get(request.method)
+            if body is not None:
+                return await route.fulfill(status=200, content_type="application/json", body=body)
+    await route.fulfill(status=200, content_type="application/json", body=EMPTY_BODY)
+
+
+# Demo chat bubbles for step 3, pre-rendered to HTML here so the in-page
+# script does no Markdown parsing. Tool events still go through the page's
+# own buildToolCallHtml/buildToolResultHtml (they generate ids the expand
+# step relies on), but everything lands in one innerHTML assignment —
+# a single DOM mutation instead of eight insertAdjacentHTML calls.
+_USER_MSG_HTML = (
+    '<div class="msg user"><div class="bubble">'
+    "帮我查一下 nanobot 的 GitHub star 数，然后存到备忘录里"
+    "</div></div>"
+)
+_ASSISTANT_MSG_HTML = (
+    '<div class="msg assistant"><div class="bubble">'
+    "查到了！nanobot 目前有 <strong>2.3k</strong> star，已经帮你记到 <code>memo.md</code> 里了。"
+    "</div></div>"
+)
+
+# Demo helpers registered once per page via add_init_script; each step then
+# ships a one-line evaluate instead of the full script body over CDP.
+DEMO_JS = f"""
+window.__renderLiveChat = () => {{
+  const html = {json.dumps(_USER_MSG_HTML, ensure_ascii=False)}
+    + buildToolCallHtml('web_search', JSON.stringify({{query: 'nanobot github stars'}}))
+    + buildToolResultHtml('web_search', 'nanobot — ultra-lightweight personal AI assistant. Stars: 2.3k')
+    + buildToolCallHtml('write_file', JSON.stringify({{path: 'memo.md', content: 'nanobot stars: 2.3k'}}))
+    + buildToolResultHtml('write_file', 'Wrote 21 bytes to memo.md')
+    + {json.dumps(_ASSISTANT_MSG_HTML, ensure_ascii=False)};
+  const area = document.getElementById('chatArea');
+  area.innerHTML = html;
+  area.scrollTop = area.scrollHeight;
+  isLiveChat = true;
+}};
+window.__expandToolEvents = (n) => {{
+  document.querySelectorAll('.tool-event-body').forEach((b, i) => {{ if (i < n) b.classList.add('open'); }});
+  document.querySelectorAll('.tool-toggle').forEach((t, i) => {{ if (i < n) t.classList.add('open'); }});
+}};
+"""
+
+
+# Resource types the screenshots don't need: external fonts, favicons and
+# media only add bytes and round-trips to page.goto. index.html inlines all
+# of its CSS, so stylesheets stay allowed for safety.
+_ABORT_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+async def _asset_route(route, request):
+    if request.resource_type in _ABORT_RESOURCE_TYPES and "/api/" not in request.url:
+        await route.abort()
+    else:
+        await route.fallback()
+
+
+async def _enable_cache(ctx, page):
+    """Re-enable Chromium's HTTP cache for a routed page.
+
+    Playwright disables the cache whenever routes are registered; the
+    /api/** mocks are still intercepted, so only the static JS/CSS of
+    index.html benefits — repeat loads become near zero-byte.
+    """
+    cdp = await ctx.new_cdp_session(page)
+    await cdp.send("Network.setCacheDisabled", {"cacheDisabled": False})
+
+
+async def _register_routes(ctx):
+    """Install mock handlers once on a BrowserContext.
+
+    Context-level routes apply to every page in the context, so each flow
+    registers its handler set exactly once instead of per page. Playwright
+    matches routes in reverse registration order, so the catch-all asset
+    filter goes first and the API mocks still win.
+    """
+    await ctx.route("**/*", _asset_route)
+    await ctx.route("**/api/**", mock_route)
+    await ctx.route("**/health", mock_route)
+
+
+# Steps 1-7 as data: keys run in order — click/fill/expand_all, then
+# wait/wait_fn, then js + js_wait, then shot. Keeping the sequence
+# declarative makes individual steps easy to reorder or split out.
+DESKTOP_STEPS = [
+    # session list + chat (dark)
+    {"click": ".session-item", "wait": ".msg .bubble", "shot": "01-session-dark.png"},
+    # light theme: replayed from a DOM snapshot, no live toggling
+    {"snapshot_light": "02-session-light.png"},
+    # live chat with tool events
+    {"click": "#liveChatBtn", "wait": "#chatArea", "js": "window.__renderLiveChat()", "js_wait": ".tool-event-header", "shot": "03-livechat-tools.png"},
+    # expand the tool-call events
+    {"js": "window.__expandToolEvents(4)", "js_wait": ".tool-event-body.open", "shot": "04-livechat-expanded.png"},
+    # knowledge base browser
+    {"click": "#vikingBtn", "wait": ".viking-item", "shot": "05-viking-browser.png"},
+    # knowledge base search
+    {"fill": ("#vikingSearchInput", "feishu 配置"), "click": ".viking-search button", "wait": ".viking-result", "shot": "06-viking-search.png"},
+    # settings panel
+    {"click": "#settingsBtn", "wait": "#cfgModel", "shot": "07-settings.png"},
+]
+
+
+async def _wait_app_ready(page):
+    """Wait for the SPA bootstrap to finish rendering the session list.
+
+    All MOCK_SESSIONS rendered means loadSessions has completed — an exact
+    data-ready signal instead of waiting for the load event.
+    """
+    await page.wait_for_function(
+        "n => document.querySelectorAll('.session-item').length === n",
+        arg=len(MOCK_SESSIONS),
+    )
+
+
+# Pending PNG disk writes, flushed at the end of take_screenshots so the
+# next step's browser work overlaps the previous file flush.
+_write_tasks: list[asyncio.Task] = []
+
+
+def _write_png(path: str, buf: bytes):
+    with open(path, "wb") as f:
+        f.write(buf)
+
+
+async def _save_shot(page, name: str):
+    buf = await page.screenshot()
+    _write_tasks.append(
+        asyncio.create_task(asyncio.to_thread(_write_png, f"{SCREENSHOTS_DIR}/{name}", buf))
+    )
+
+
+async def _run_step(page, step):
+    if step.get("snapshot_light"):
+        # The light-theme shot depends only on static rendering, so replay
+        # a snapshot of the current DOM with the `light` class on <body>
+        # instead of toggling the live theme twice. Scripts are stripped so
+        # the SPA doesn't re-bootstrap against the mocked API.
+        html = await page.content()
+        html = html.replace("<body", '<body class="light"', 1)
+        html = re.sub(r"<script\b.*?</script>", "", html, flags=re.S)
+        page2 = await page.context.new_page()
+        await page2.set_content(html)
+        await _save_shot(page2, step["snapshot_light"])
+        await page2.close()
+    if step.get("fill"):
+        sel, value = step["fill"]
+        await page.fill(sel, value)
+    if step.get("click"):
+        await page.click(step["click"])
+    if step.get("wait"):
+        await page.wait_for_selector(step["wait"], state="visible")
+    if step.get("wait_fn"):
+        await page.wait_for_function(step["wait_fn"])
+    if step.get("js"):
+        await page.evaluate(step["js"])
+        if step.get("js_wait"):
+            await page.wait_for_selector(step["js_wait"], state="visible")
+    if step.get("shot"):
+        await _save_shot(page, step["shot"])
+
+
+DESKTOP_VIEWPORT = {"width": 1280, "height": 800}
+MOBILE_VIEWPORT = {"width": 390, "height": 844}
+
+# Set NANOBOT_SCREENSHOT_PROFILE to a directory to persist Chromium's disk
+# cache across runs (second and later invocations skip re-downloading and
+# re-parsing the bundle). A user-data-dir allows only one context, so in
+# profile mode the flows run sequentially on it.
+PROFILE_DIR = os.environ.get("NANOBOT_SCREENSHOT_PROFILE", "")
+
+# Set PLAYWRIGHT_CDP (e.g. http://127.0.0.1:9222) to reuse an already
+# running Chromium instead of paying process spawn + V8 init per run.
+# Launch the sidecar once with:
+#   chromium --headless --remote-debugging-port=9222 --user-data-dir=.cache/chrome
+REMOTE_CDP = os.environ.get("PLAYWRIGHT_CDP", "")
+
+
+async def _desktop_flow(ctx):
+    """Steps 1-7: the 1280x800 desktop sequence."""
+    page = await ctx.new_page()
+    await page.add_init_script(DEMO_JS)
+    await _enable_cache(ctx, page)
+
+    await page.goto(f"http://127.0.0.1:{PORT}/index.html?mockWs=1", wait_until="domcontentloaded")
+    await _wait_app_ready(page)
+    for step in DESKTOP_STEPS:
+        await _run_step(page, step)
+
+    await page.close()
+
+
+async def _mobile_flow(ctx, resize=False):
+    """Step 8: the 390x844 mobile layout."""
+    page = await ctx.new_page()
+    if resize:  # profile mode: single context, viewport set per page
+        await page.set_viewport_size(MOBILE_VIEWPORT)
+    await _enable_cache(ctx, page)
+    await page.goto(f"http://127.0.0.1:{PORT}/index.html?mockWs=1", wait_until="domcontentloaded")
+    await _wait_app_ready(page)
+    await _save_shot(page, "08-mobile.png")
+    await page.close()
+
+
+async def take_screenshots():
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+    async with async_playwright() as p:
+        if PROFILE_DIR:
+            ctx = await p.chromium.launch_persistent_context(
+                PROFILE_DIR, viewport=DESKTOP_VIEWPORT
+            )
+            await _register_routes(ctx)
+            await _desktop_flow(ctx)
+            await _mobile_flow(ctx, resize=True)
+            await ctx.close()
+            await asyncio.gather(*_write_tasks)
+            return
+        if REMOTE_CDP:
+            browser = await p.chromium.connect_over_cdp(REMOTE_CDP)
+        else:
+            browser = await p.chromium.launch()
+        desktop_ctx = await browser.new_context(viewport=DESKTOP_VIEWPORT)
+        mobile_ctx = await browser.new_context(
+            viewport=MOBILE_VIEWPORT,
+            is_mobile=True,
+            has_touch=True,
+            device_scale_factor=3,
+        )
+        await _register_routes(desktop_ctx)
+        await _register_routes(mobile_ctx)
+        # The two flows share no state (separate contexts, mocked API) and
+        # are dominated by waits, so run them concurrently.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(_desktop_flow(desktop_ctx))
+            tg.create_task(_mobile_flow(mobile_ctx))
+        # For a connected browser this only drops the CDP connection; the
+        # sidecar process keeps running for the next invocation.
+        await browser.close()
+        await asyncio.gather(*_write_tasks)
+
+
+_CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".json": "application/json",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+}
+
+
+def _preload_static() -> dict[str, tuple[bytes, str]]:
+    """Read the package's static files into RAM once at startup."""
+    files = {}
+    for dirpath, _dirnames, filenames in os.walk(PKG_DIR):
+        for fname in filenames:
+            fpath = os.path.join(dirpath, fname)
+            url_path = "/" + os.path.relpath(fpath, PKG_DIR).replace(os.sep, "/")
+            ext = os.path.splitext(fname)[1].lower()
+            with open(fpath, "rb") as f:
+                files[url_path] = (f.read(), _CONTENT_TYPES.get(ext, "application/octet-stream"))
+    return files
+
+
+async def main():
+    # Static file server on the same event loop as Playwright — no daemon
+    # thread, no GIL contention with the browser I/O. Files are preloaded
+    # into memory so requests during screenshot runs hit no disk at all.
+    files = _preload_static()
+
+    async def serve(request):
+        hit = files.get(request.path)
+        if hit is None:
+            raise web.HTTPNotFound()
+        body, content_type = hit
+        return web.Response(body=body, content_type=content_type.split(";")[0])
+
+    static_app = web.Application()
+    static_app.router.add_get("/{tail:.*}", serve)
+    runner = web.AppRunner(static_app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", PORT)
+    await site.start()
+    try:
+        await take_screenshots()
+    finally:
+        await runner.cleanup()
+    print(f"Screenshots written to {SCREENSHOTS_DIR}/")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())